@@ -45,6 +45,35 @@ __all__ = [
     'daylight_locus_function'
 ]
 
+_CACHE_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES = None
+
+_CACHE_SD_CIE_ILLUMINANT_D_SERIES = None
+
+
+def _basis_functions_CIE_illuminant_D_series():
+    """
+    Returns the *CIE Illuminant D Series* :math:`S_0`, :math:`S_1` and
+    :math:`S_2` basis functions wavelengths and values and caches them if not
+    existing.
+
+    Returns
+    -------
+    tuple
+        Basis functions wavelengths and stacked values of shape (3, n).
+    """
+
+    global _CACHE_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES
+
+    if _CACHE_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES is None:
+        _CACHE_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES = (
+            SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES['S0'].wavelengths,
+            np.vstack([
+                SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES[S].values
+                for S in ('S0', 'S1', 'S2')
+            ]))
+
+    return _CACHE_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES
+
 
 def sd_CIE_standard_illuminant_A(shape=SPECTRAL_SHAPE_DEFAULT):
     """
@@ -149,6 +178,8 @@ def sd_CIE_illuminant_D_series(xy, M1_M2_rounding=True):
         1.4388 / 1.4380.
     -   :math:`M1` and :math:`M2` variables are rounded to 3 decimal places
          according to *CIE 015:2004* recommendation.
+    -   The spectral distributions are cached per *CIE xy* chromaticity
+        coordinates, a copy is returned so that it can be safely modified.
 
     References
     ----------
@@ -275,6 +306,16 @@ def sd_CIE_illuminant_D_series(xy, M1_M2_rounding=True):
                          extrapolator_kwargs={...})
     """
 
+    global _CACHE_SD_CIE_ILLUMINANT_D_SERIES
+    if _CACHE_SD_CIE_ILLUMINANT_D_SERIES is None:
+        _CACHE_SD_CIE_ILLUMINANT_D_SERIES = {}
+
+    hash_key = tuple([
+        hash(arg) for arg in (as_float_array(xy).tobytes(), M1_M2_rounding)
+    ])
+    if hash_key in _CACHE_SD_CIE_ILLUMINANT_D_SERIES:
+        return _CACHE_SD_CIE_ILLUMINANT_D_SERIES[hash_key].copy()
+
     x, y = tsplit(xy)
 
     M = 0.0241 + 0.2562 * x - 0.7341 * y
@@ -285,18 +326,20 @@ def sd_CIE_illuminant_D_series(xy, M1_M2_rounding=True):
         M1 = np.around(M1, 3)
         M2 = np.around(M2, 3)
 
-    S0 = SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES['S0']
-    S1 = SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES['S1']
-    S2 = SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES['S2']
+    wavelengths, S = _basis_functions_CIE_illuminant_D_series()
 
-    distribution = S0.values + M1 * S1.values + M2 * S2.values
+    distribution = S[0] + M1 * S[1] + M2 * S[2]
 
-    return SpectralDistribution(
+    sd = SpectralDistribution(
         distribution,
-        S0.wavelengths,
+        wavelengths,
         name='CIE xy ({0}, {1}) - CIE Illuminant D Series'.format(*xy),
         interpolator=LinearInterpolator)
 
+    _CACHE_SD_CIE_ILLUMINANT_D_SERIES[hash_key] = sd.copy()
+
+    return sd
+
 
 def daylight_locus_function(x_D):
     """
@@ -170,6 +170,25 @@ sd_CIE_illuminant_D_series` definition.
                 rtol=tolerance,
                 atol=tolerance)
 
+    def test_cache_sd_CIE_illuminant_D_series(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.\
+sd_CIE_illuminant_D_series` definition cache.
+        """
+
+        xy = CCT_to_xy_CIE_D(6504)
+        sd_r = sd_CIE_illuminant_D_series(xy)
+        values = sd_r.values
+
+        sd_r *= 2
+
+        sd_t = sd_CIE_illuminant_D_series(xy)
+        np.testing.assert_equal(sd_t.values, values)
+        self.assertIsNot(sd_t, sd_CIE_illuminant_D_series(xy))
+
+        self.assertNotEqual(
+            sd_CIE_illuminant_D_series(xy, M1_M2_rounding=False), sd_t)
+
 
 class TestDaylightLocusFunction(unittest.TestCase):
     """
@@ -30,6 +30,7 @@ from copy import deepcopy
 from colour.models import xy_to_XYZ, xy_to_xyY, xyY_to_XYZ
 from colour.models.rgb import (chromatically_adapted_primaries,
                                normalised_primary_matrix)
+from colour.models.rgb.transfer_functions import linear_function
 from colour.adaptation import matrix_chromatic_adaptation_VonKries
 from colour.utilities import (as_float_array, domain_range_scale, matrix_dot,
                               vector_dot, filter_kwargs, from_range_1,
@@ -1159,7 +1160,11 @@ def RGB_to_RGB(RGB,
 
     RGB = to_domain_1(RGB)
 
-    if apply_cctf_decoding:
+    # Linear colourspaces use the identity "linear_function" definition as
+    # transfer functions: applying it is not worth the keyword arguments
+    # filtering and domain-range scale overhead.
+    if (apply_cctf_decoding and
+            input_colourspace.cctf_decoding is not linear_function):
         with domain_range_scale('ignore'):
             RGB = input_colourspace.cctf_decoding(
                 RGB, **filter_kwargs(input_colourspace.cctf_decoding,
@@ -1170,7 +1175,8 @@ def RGB_to_RGB(RGB,
 
     RGB = vector_dot(M, RGB)
 
-    if apply_cctf_encoding:
+    if (apply_cctf_encoding and
+            output_colourspace.cctf_encoding is not linear_function):
         with domain_range_scale('ignore'):
             RGB = output_colourspace.cctf_encoding(
                 RGB, **filter_kwargs(output_colourspace.cctf_encoding,
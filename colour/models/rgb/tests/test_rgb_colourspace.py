@@ -775,6 +775,18 @@ class TestRGB_to_RGB(unittest.TestCase):
             np.array([0.60983062, 0.67896356, 0.50435764]),
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            RGB_to_RGB(
+                np.array([0.21931722, 0.06950287, 0.04694832]),
+                aces_cg_colourspace,
+                aces_2065_1_colourspace,
+                apply_cctf_decoding=True,
+                apply_cctf_encoding=True),
+            RGB_to_RGB(
+                np.array([0.21931722, 0.06950287, 0.04694832]),
+                aces_cg_colourspace, aces_2065_1_colourspace),
+            decimal=7)
+
         np.testing.assert_equal(
             RGB_to_RGB(
                 np.array([0.21931722, 0.06950287, 0.04694832]),
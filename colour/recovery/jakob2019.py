@@ -20,19 +20,20 @@ References
 
 import numpy as np
 import struct
-from scipy.optimize import minimize
+from scipy.optimize import least_squares
 from scipy.interpolate import RegularGridInterpolator
 
 from colour import SDS_ILLUMINANTS
-from colour.algebra import spow, smoothstep_function
-from colour.colorimetry import (
-    MSDS_CMFS_STANDARD_OBSERVER, SpectralDistribution, SpectralShape,
-    intermediate_lightness_function_CIE1976, sd_to_XYZ)
+from colour.algebra import smoothstep_function
+from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER,
+                                SpectralDistribution, SpectralShape,
+                                sd_to_XYZ)
+from colour.constants import EPSILON
 from colour.difference import JND_CIE1976
 from colour.models import XYZ_to_xy, XYZ_to_Lab, RGB_to_XYZ
 from colour.utilities import (as_float_array, domain_range_scale, full,
-                              index_along_last_axis, is_tqdm_installed,
-                              message_box, to_domain_1, runtime_warning, zeros)
+                              is_tqdm_installed, message_box, to_domain_1,
+                              runtime_warning, tsplit, tstack, zeros)
 try:
     from unittest import mock
 except ImportError:  # pragma: no cover
@@ -62,10 +63,12 @@ Spectral shape for *Jakob and Hanika (2019)* method.
 SPECTRAL_SHAPE_JAKOB2019 : SpectralShape
 """
 
+_CACHE_ILLUMINANT_ALIGNED_JAKOB2019 = None
+
 
 class StopMinimizationEarly(Exception):
     """
-    The exception used to stop :func:`scipy.optimize.minimize` once the
+    The exception used to stop :func:`scipy.optimize.least_squares` once the
     value of the minimized function is small enough. *SciPy* doesn't currently
     offer a better way of doing it.
 
@@ -108,6 +111,81 @@ class StopMinimizationEarly(Exception):
         return self._error
 
 
+def _align_illuminant(illuminant, cmfs, shape):
+    """
+    Aligns given illuminant to given colour matching functions shape if
+    required and caches it if not existing.
+
+    Parameters
+    ----------
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    shape : SpectralShape
+        Colour matching functions shape.
+
+    Returns
+    -------
+    SpectralDistribution
+        Aligned illuminant spectral distribution, must not be modified.
+    """
+
+    # Comparing the shapes attributes directly is much cheaper than
+    # :meth:`colour.SpectralShape.__eq__` method which compares the
+    # wavelengths ranges.
+    illuminant_shape = illuminant.shape
+    if ((illuminant_shape.start, illuminant_shape.end,
+         illuminant_shape.interval) == (shape.start, shape.end,
+                                        shape.interval)):
+        return illuminant
+
+    runtime_warning('Aligning "{0}" illuminant shape to "{1}" colour matching '
+                    'functions shape.'.format(illuminant.name, cmfs.name))
+
+    global _CACHE_ILLUMINANT_ALIGNED_JAKOB2019
+    if _CACHE_ILLUMINANT_ALIGNED_JAKOB2019 is None:
+        _CACHE_ILLUMINANT_ALIGNED_JAKOB2019 = {}
+
+    hash_key = tuple([hash(arg) for arg in (illuminant, shape)])
+    if hash_key in _CACHE_ILLUMINANT_ALIGNED_JAKOB2019:
+        return _CACHE_ILLUMINANT_ALIGNED_JAKOB2019[hash_key]
+
+    illuminant = illuminant.copy().align(shape)
+
+    _CACHE_ILLUMINANT_ALIGNED_JAKOB2019[hash_key] = illuminant
+
+    return illuminant
+
+
+def _spectral_model(coefficients, wavelengths):
+    """
+    Returns the reflectance values of the spectral model given by *Jakob and
+    Hanika (2019)* at given wavelengths.
+
+    Parameters
+    ----------
+    coefficients : array_like, (..., 3)
+        Dimensionful coefficients for *Jakob and Hanika (2019)* reflectance
+        spectral model.
+    wavelengths : array_like, (n,)
+        Wavelengths :math:`\\lambda` to evaluate the spectral model at.
+
+    Returns
+    -------
+    ndarray, (..., n)
+        Reflectance values.
+    """
+
+    c_0, c_1, c_2 = tsplit(coefficients)
+    wl = as_float_array(wavelengths)
+
+    U = (c_0[..., np.newaxis] * wl ** 2 + c_1[..., np.newaxis] * wl +
+         c_2[..., np.newaxis])
+
+    return 1 / 2 + U / (2 * np.sqrt(1 + U ** 2))
+
+
 def sd_Jakob2019(coefficients, shape=SPECTRAL_SHAPE_JAKOB2019):
     """
     Returns a spectral distribution following the spectral model given by
@@ -158,10 +236,8 @@ def sd_Jakob2019(coefficients, shape=SPECTRAL_SHAPE_JAKOB2019):
                          extrapolator_kwargs={...})
     """
 
-    c_0, c_1, c_2 = as_float_array(coefficients)
     wl = shape.range()
-    U = c_0 * wl ** 2 + c_1 * wl + c_2
-    R = 1 / 2 + U / (2 * np.sqrt(1 + U ** 2))
+    R = _spectral_model(coefficients, wl)
 
     name = '{0} (COEFF) - Jakob (2019)'.format(coefficients)
 
@@ -216,61 +292,178 @@ def error_function(coefficients,
         Raised when the error is below ``max_error``.
     """
 
-    c_0, c_1, c_2 = as_float_array(coefficients)
-    wv = np.linspace(0, 1, len(cmfs.shape))
+    return _error_function(coefficients, target,
+                           *_error_function_invariants(cmfs, illuminant),
+                           max_error=max_error,
+                           additional_data=additional_data)
+
+
+def _error_function_invariants(cmfs, illuminant):
+    """
+    Computes the quantities used by :func:`colour.recovery.jakob2019.\
+_error_function` definition that only depend on the colour matching functions
+    and illuminant, so that they can be computed once per optimisation rather
+    than on each evaluation.
 
-    U = c_0 * wv ** 2 + c_1 * wv + c_2
-    t1 = np.sqrt(1 + U ** 2)
-    R = 1 / 2 + U / (2 * t1)
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
 
-    t2 = 1 / (2 * t1) - U ** 2 / (2 * t1 ** 3)
-    dR = np.array([wv ** 2 * t2, wv * t2, t2])
+    Returns
+    -------
+    tuple
+        Weighting factors of shape (3, n), i.e. the transposed colour
+        matching functions values multiplied by the illuminant values and
+        normalisation factor :math:`k`, dimensionless wavelengths normalised
+        to [0, 1] range and their squares, and illuminant *CIE XYZ*
+        tristimulus values normalised so that :math:`Y_n = 1`.
+    """
 
-    E = illuminant.values * R
-    dE = illuminant.values * dR
+    cmfs_values = np.transpose(cmfs.values)
+    illuminant_values = illuminant.values
 
-    dw = cmfs.wavelengths[1] - cmfs.wavelengths[0]
-    k = 1 / (np.sum(cmfs.values[:, 1] * illuminant.values) * dw)
+    k = 1 / np.sum(cmfs_values[1] * illuminant_values)
+    W = np.ascontiguousarray(
+        k * cmfs_values * illuminant_values, dtype=np.float64)
 
-    XYZ = k * np.dot(E, cmfs.values) * dw
-    dXYZ = np.transpose(k * np.dot(dE, cmfs.values) * dw)
+    wv = np.linspace(0, 1, len(illuminant_values))
+    wv_2 = wv ** 2
 
     XYZ_n = sd_to_XYZ(illuminant, cmfs)
     XYZ_n /= XYZ_n[1]
+
+    return W, wv, wv_2, XYZ_n
+
+
+def _residual_function(coefficients,
+                       target,
+                       W,
+                       wv,
+                       wv_2,
+                       XYZ_n,
+                       additional_data=False):
+    """
+    Computes the residuals between the target colour and the colour defined
+    by given spectral model in *CIE L\\*a\\*b\\** colourspace, along with
+    their Jacobian, using the quantities returned by
+    :func:`colour.recovery.jakob2019._error_function_invariants` definition.
+
+    Parameters
+    ----------
+    coefficients : array_like
+        Dimensionless coefficients for *Jakob and Hanika (2019)* reflectance
+        spectral model.
+    target : array_like, (3,)
+        *CIE L\\*a\\*b\\** colourspace array of the target colour.
+    W : ndarray, (3, n)
+        Weighting factors.
+    wv : ndarray, (n,)
+        Dimensionless wavelengths.
+    wv_2 : ndarray, (n,)
+        Squared dimensionless wavelengths.
+    XYZ_n : ndarray, (3,)
+        Illuminant *CIE XYZ* tristimulus values.
+    additional_data : bool, optional
+        If *True*, some intermediate calculations are returned: R, XYZ and
+        Lab.
+
+    Returns
+    -------
+    Lab_t : ndarray, (3,)
+        Residuals, i.e. the difference between the *CIE L\\*a\\*b\\**
+        colourspace array of the colour defined by the spectral model and
+        the target colour.
+    dLab : ndarray, (3, 3)
+        Jacobian of the residuals with respect to the input coefficients.
+    R : ndarray
+        Computed spectral reflectance.
+    XYZ : ndarray, (3,)
+        *CIE XYZ* tristimulus values corresponding to ``R``.
+    Lab : ndarray, (3,)
+        *CIE L\\*a\\*b\\** colourspace array corresponding to ``XYZ``.
+    """
+
+    c_0, c_1, c_2 = as_float_array(coefficients)
+
+    U = c_0 * wv_2 + c_1 * wv + c_2
+    t1 = 1 / np.sqrt(1 + U ** 2)
+    R = 1 / 2 + U * t1 / 2
+
+    # The derivative of "R" with respect to "U", i.e.
+    # "1 / (2 * sqrt(1 + U ** 2)) - U ** 2 / (2 * (1 + U ** 2) ** (3 / 2))",
+    # simplifies to "1 / (2 * (1 + U ** 2) ** (3 / 2))".
+    t2 = t1 ** 3 / 2
+
+    # "R" and its derivatives with respect to the coefficients, i.e.
+    # "wv ** 2 * t2", "wv * t2" and "t2", are stacked so that the tristimulus
+    # values and their derivatives are computed with a single product.
+    XYZ_dXYZ = np.dot(W, np.transpose([R, wv_2 * t2, wv * t2, t2]))
+    XYZ, dXYZ = XYZ_dXYZ[:, 0], XYZ_dXYZ[:, 1:]
+
     XYZ_XYZ_n = XYZ / XYZ_n
 
-    XYZ_f = intermediate_lightness_function_CIE1976(XYZ, XYZ_n)
-    dXYZ_f = np.where(
-        XYZ_XYZ_n[..., np.newaxis] > (24 / 116) ** 3,
-        1 / (3 * spow(XYZ_n[..., np.newaxis], 1 / 3) * spow(
-            XYZ[..., np.newaxis], 2 / 3)) * dXYZ,
-        (841 / 108) * dXYZ / XYZ_n[..., np.newaxis],
-    )
+    # Intermediate non-linear function of the *CIE 1976* lightness, see
+    # :func:`colour.colorimetry.intermediate_lightness_function_CIE1976`
+    # definition, and its derivative reusing the cube root.
+    f = np.cbrt(XYZ_XYZ_n)
+    is_linear = XYZ_XYZ_n <= (24 / 116) ** 3
+    XYZ_f = np.where(is_linear, (841 / 108) * XYZ_XYZ_n + 16 / 116, f)
+    dXYZ_f = (np.where(is_linear, 841 / 108, 1 / (3 * f ** 2)) /
+              XYZ_n)[..., np.newaxis] * dXYZ
+
+    Lab = np.array([
+        116 * XYZ_f[1] - 16,
+        500 * (XYZ_f[0] - XYZ_f[1]),
+        200 * (XYZ_f[1] - XYZ_f[2]),
+    ])
+    dLab = np.array([
+        116 * dXYZ_f[1],
+        500 * (dXYZ_f[0] - dXYZ_f[1]),
+        200 * (dXYZ_f[1] - dXYZ_f[2]),
+    ])
+
+    Lab_t = Lab - target
 
-    def intermediate_XYZ_to_Lab(XYZ_i, offset=16):
-        """
-        Returns the final intermediate value for the *CIE Lab* to *CIE XYZ*
-        conversion.
-        """
+    if additional_data:
+        return Lab_t, dLab, R, XYZ, Lab
+    else:
+        return Lab_t, dLab
 
-        return np.array([
-            116 * XYZ_i[1] - offset, 500 * (XYZ_i[0] - XYZ_i[1]),
-            200 * (XYZ_i[1] - XYZ_i[2])
-        ])
 
-    Lab_i = intermediate_XYZ_to_Lab(XYZ_f)
-    dLab_i = intermediate_XYZ_to_Lab(dXYZ_f, 0)
+def _error_function(coefficients,
+                    target,
+                    W,
+                    wv,
+                    wv_2,
+                    XYZ_n,
+                    max_error=None,
+                    additional_data=False):
+    """
+    Computes :math:`\\Delta E_{76}` between the target colour and the colour
+    defined by given spectral model, along with its gradient, using the
+    quantities returned by :func:`colour.recovery.jakob2019.\
+_error_function_invariants` definition.
+
+    Refer to :func:`colour.recovery.jakob2019.error_function` definition for
+    the parameters and returned values description.
+    """
 
-    error = np.sqrt(np.sum((Lab_i - target) ** 2))
+    Lab_t, dLab, R, XYZ, Lab = _residual_function(
+        coefficients, target, W, wv, wv_2, XYZ_n, additional_data=True)
+
+    error = np.sqrt(np.dot(Lab_t, Lab_t))
     if max_error is not None and error <= max_error:
         raise StopMinimizationEarly(coefficients, error)
 
-    derror = np.sum(
-        dLab_i * (Lab_i[..., np.newaxis] - target[..., np.newaxis]),
-        axis=0) / error
+    # The gradient is undefined on an exact match, "EPSILON" avoids returning
+    # *NaN* values to the optimiser.
+    derror = np.dot(Lab_t, dLab) / max(error, EPSILON)
 
     if additional_data:
-        return error, derror, R, XYZ, Lab_i
+        return error, derror, R, XYZ, Lab
     else:
         return error, derror
 
@@ -287,20 +480,20 @@ def dimensionalise_coefficients(coefficients, shape):
 
     Parameters
     ----------
-    coefficients : array_like, (3,)
+    coefficients : array_like, (..., 3)
         Dimensionless coefficients.
     shape : SpectralShape
         Spectral distribution shape used in calculations.
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (..., 3)
         Dimensionful coefficients, with units of
         :math:`\\frac{1}{\\mathrm{nm}^2}`, :math:`\\frac{1}{\\mathrm{nm}}`
         and 1, respectively.
     """
 
-    cp_0, cp_1, cp_2 = coefficients
+    cp_0, cp_1, cp_2 = tsplit(coefficients)
     span = shape.end - shape.start
 
     c_0 = cp_0 / span ** 2
@@ -308,7 +501,7 @@ def dimensionalise_coefficients(coefficients, shape):
     c_2 = (
         cp_0 * shape.start ** 2 / span ** 2 - cp_1 * shape.start / span + cp_2)
 
-    return np.array([c_0, c_1, c_2])
+    return tstack([c_0, c_1, c_2])
 
 
 def lightness_scale(steps):
@@ -355,14 +548,15 @@ def find_coefficients_Jakob2019(
 
     Parameters
     ----------
-    XYZ : array_like, (3,)
+    XYZ : array_like, (..., 3)
         *CIE XYZ* tristimulus values to find the coefficients for.
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralDistribution
         Illuminant spectral distribution.
     coefficients_0 : array_like, (3,), optional
-        Starting coefficients for the solver.
+        Dimensionless starting coefficients for the solver, the feedback
+        process is only used if they do not converge.
     max_error : float, optional
         Maximal acceptable error. Set higher to save computational time.
         If *None*, the solver will keep going until it is very close to the
@@ -373,12 +567,21 @@ def find_coefficients_Jakob2019(
 
     Returns
     -------
-    coefficients : ndarray, (3,)
+    coefficients : ndarray, (..., 3)
         Computed coefficients that best fit the given colour.
-    error : float
+    error : numeric or ndarray
         :math:`\\Delta E_{76}` between the target colour and the colour
         corresponding to the computed coefficients.
 
+    Notes
+    -----
+    -   The solver is warm-started from ``coefficients_0`` and only falls
+        back to the feedback process, starting from a neutral grey, when it
+        does not converge.
+    -   When multiple *CIE XYZ* tristimulus values are given, they are solved
+        in *CIE L\\*a\\*b\\** order, each one after the first being
+        warm-started from the coefficients of the previously solved one.
+
     References
     ----------
     :cite:`Jakob2019`
@@ -387,70 +590,131 @@ def find_coefficients_Jakob2019(
     --------
     >>> XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
     >>> find_coefficients_Jakob2019(XYZ)  # doctest: +ELLIPSIS
-    (array([  1.3723791...e-04,  -1.3514399...e-01,   3.0838973...e+01]), \
-0.0141941...)
+    (array([  1.3728764...e-04,  -1.3519513...e-01,   3.0850956...e+01]), \
+0.0001381...)
     """
 
     shape = cmfs.shape
 
-    if illuminant.shape != shape:
-        runtime_warning(
-            'Aligning "{0}" illuminant shape to "{1}" colour matching '
-            'functions shape.'.format(illuminant.name, cmfs.name))
-        illuminant = illuminant.copy().align(cmfs.shape)
+    illuminant = _align_illuminant(illuminant, cmfs, shape)
+
+    XYZ = as_float_array(XYZ)
+
+    W, wv, wv_2, XYZ_n = _error_function_invariants(cmfs, illuminant)
 
     def optimize(target_o, coefficients_0_o):
         """
-        Minimises the error function using *L-BFGS-B* method.
+        Minimises the residuals using *Levenberg-Marquardt* method.
         """
 
+        # The residuals and their Jacobian are computed together, the
+        # latter is kept for the optimiser subsequent request.
+        evaluation = {}
+
+        def residuals(coefficients):
+            """
+            Computes the residuals and stores their Jacobian.
+            """
+
+            Lab_t, dLab = _residual_function(coefficients, target_o, W, wv,
+                                             wv_2, XYZ_n)
+
+            error = np.sqrt(np.dot(Lab_t, Lab_t))
+            if max_error is not None and error <= max_error:
+                raise StopMinimizationEarly(coefficients, error)
+
+            evaluation['coefficients'] = np.copy(coefficients)
+            evaluation['dLab'] = dLab
+
+            return Lab_t
+
+        def jacobian(coefficients):
+            """
+            Returns the Jacobian of the residuals.
+            """
+
+            if not np.array_equal(coefficients,
+                                  evaluation.get('coefficients')):
+                residuals(coefficients)
+
+            return evaluation['dLab']
+
         try:
-            result = minimize(
-                error_function,
-                coefficients_0_o, (target_o, cmfs, illuminant, max_error),
-                method='L-BFGS-B',
-                jac=True)
+            result = least_squares(
+                residuals, coefficients_0_o, jac=jacobian, method='lm')
 
-            return result.x, result.fun
+            return result.x, np.sqrt(np.dot(result.fun, result.fun))
         except StopMinimizationEarly as error:
             return error.coefficients, error.error
 
-    xy_n = XYZ_to_xy(sd_to_XYZ(illuminant, cmfs))
+    def feedback(XYZ_f, target_f):
+        """
+        Gradually moves from a known good solution towards the target colour
+        and minimises the error function for it.
+        """
 
-    XYZ_good = full(3, 0.5)
-    coefficients_good = zeros(3)
+        XYZ_good = full(3, 0.5)
+        coefficients_good = zeros(3)
 
-    divisions = 3
-    while divisions < 10:
-        XYZ_r = XYZ_good
-        coefficient_r = coefficients_good
-        keep_divisions = False
+        divisions = 3
+        while divisions < 10:
+            XYZ_r = XYZ_good
+            coefficient_r = coefficients_good
+            keep_divisions = False
 
-        coefficients_0 = coefficient_r
-        for i in range(1, divisions):
-            XYZ_i = (XYZ - XYZ_r) * i / (divisions - 1) + XYZ_r
-            Lab_i = XYZ_to_Lab(XYZ_i)
+            coefficients_0 = coefficient_r
+            for i in range(1, divisions):
+                XYZ_i = (XYZ_f - XYZ_r) * i / (divisions - 1) + XYZ_r
+                Lab_i = XYZ_to_Lab(XYZ_i)
 
-            coefficients_0, error = optimize(Lab_i, coefficients_0)
+                coefficients_0, error = optimize(Lab_i, coefficients_0)
 
-            if error > max_error:
-                break
+                if error > max_error:
+                    break
+                else:
+                    XYZ_good = XYZ_i
+                    coefficients_good = coefficients_0
+                    keep_divisions = True
             else:
-                XYZ_good = XYZ_i
-                coefficients_good = coefficients_0
-                keep_divisions = True
-        else:
-            break
+                break
+
+            if not keep_divisions:
+                divisions += 2
+
+        return optimize(target_f, coefficients_0)
 
-        if not keep_divisions:
-            divisions += 2
+    xy_n = XYZ_to_xy(XYZ_n)
 
-    target = XYZ_to_Lab(XYZ, xy_n)
-    coefficients, error = optimize(target, coefficients_0)
+    XYZ_t = np.reshape(XYZ, (-1, 3))
+    target = np.reshape(XYZ_to_Lab(XYZ_t, xy_n), (-1, 3))
+
+    coefficients = zeros(XYZ_t.shape)
+    error = zeros(XYZ_t.shape[0])
+
+    # Targets are visited in coarse *CIE L\*a\*b\** order so that each of
+    # them can be warm-started from the coefficients of the last solved one,
+    # or the starting coefficients for the first one, which usually
+    # converges without the lengthy feedback process.
+    L, a, b = tsplit(np.around(target / 10))
+    coefficients_w = as_float_array(coefficients_0)
+    for i in np.lexsort([b, a, L]):
+        coefficients[i], error[i] = optimize(target[i], coefficients_w)
+
+        if error[i] > max_error:
+            coefficients[i], error[i] = feedback(XYZ_t[i], target[i])
+
+        if error[i] <= max_error:
+            coefficients_w = coefficients[i]
 
     if dimensionalise:
         coefficients = dimensionalise_coefficients(coefficients, shape)
 
+    coefficients = np.reshape(coefficients, XYZ.shape)
+    error = np.reshape(error, XYZ.shape[:-1])
+
+    if XYZ.ndim == 1:
+        error = error[()]
+
     return coefficients, error
 
 
@@ -506,55 +770,55 @@ def XYZ_to_sd_Jakob2019(
     >>> sd = XYZ_to_sd_Jakob2019(XYZ, cmfs, illuminant)
     >>> with numpy_print_options(suppress=True):
     ...     sd  # doctest: +ELLIPSIS
-    SpectralDistribution([[ 360.        ,    0.4884502...],
-                          [ 370.        ,    0.3251871...],
-                          [ 380.        ,    0.2144337...],
-                          [ 390.        ,    0.1480663...],
-                          [ 400.        ,    0.1085298...],
-                          [ 410.        ,    0.0840835...],
-                          [ 420.        ,    0.0682934...],
-                          [ 430.        ,    0.0577098...],
-                          [ 440.        ,    0.0504300...],
-                          [ 450.        ,    0.0453634...],
-                          [ 460.        ,    0.0418635...],
-                          [ 470.        ,    0.0395397...],
-                          [ 480.        ,    0.0381585...],
-                          [ 490.        ,    0.0375912...],
-                          [ 500.        ,    0.0377870...],
-                          [ 510.        ,    0.0387631...],
-                          [ 520.        ,    0.0406086...],
-                          [ 530.        ,    0.0435015...],
-                          [ 540.        ,    0.0477476...],
-                          [ 550.        ,    0.0538528...],
-                          [ 560.        ,    0.0626607...],
-                          [ 570.        ,    0.0756177...],
-                          [ 580.        ,    0.0952978...],
-                          [ 590.        ,    0.1264501...],
-                          [ 600.        ,    0.1779277...],
-                          [ 610.        ,    0.2648782...],
-                          [ 620.        ,    0.4037993...],
-                          [ 630.        ,    0.5829234...],
-                          [ 640.        ,    0.7442651...],
-                          [ 650.        ,    0.8497961...],
-                          [ 660.        ,    0.9093483...],
-                          [ 670.        ,    0.9424527...],
-                          [ 680.        ,    0.9615805...],
-                          [ 690.        ,    0.9732085...],
-                          [ 700.        ,    0.9806277...],
-                          [ 710.        ,    0.9855663...],
-                          [ 720.        ,    0.9889743...],
-                          [ 730.        ,    0.9913993...],
-                          [ 740.        ,    0.9931703...],
-                          [ 750.        ,    0.9944931...],
-                          [ 760.        ,    0.9955002...],
-                          [ 770.        ,    0.9962802...],
-                          [ 780.        ,    0.9968932...]],
+    SpectralDistribution([[ 360.        ,    0.4883447...],
+                          [ 370.        ,    0.3250600...],
+                          [ 380.        ,    0.2143233...],
+                          [ 390.        ,    0.1479801...],
+                          [ 400.        ,    0.1084630...],
+                          [ 410.        ,    0.0840304...],
+                          [ 420.        ,    0.0682498...],
+                          [ 430.        ,    0.0576728...],
+                          [ 440.        ,    0.0503977...],
+                          [ 450.        ,    0.0453344...],
+                          [ 460.        ,    0.0418368...],
+                          [ 470.        ,    0.0395145...],
+                          [ 480.        ,    0.0381344...],
+                          [ 490.        ,    0.0375675...],
+                          [ 500.        ,    0.0377632...],
+                          [ 510.        ,    0.0387389...],
+                          [ 520.        ,    0.0405833...],
+                          [ 530.        ,    0.0434747...],
+                          [ 540.        ,    0.0477184...],
+                          [ 550.        ,    0.0538202...],
+                          [ 560.        ,    0.0626234...],
+                          [ 570.        ,    0.0755739...],
+                          [ 580.        ,    0.0952448...],
+                          [ 590.        ,    0.1263845...],
+                          [ 600.        ,    0.1778468...],
+                          [ 610.        ,    0.2647862...],
+                          [ 620.        ,    0.4037206...],
+                          [ 630.        ,    0.5828960...],
+                          [ 640.        ,    0.7442851...],
+                          [ 650.        ,    0.8498299...],
+                          [ 660.        ,    0.9093784...],
+                          [ 670.        ,    0.9424759...],
+                          [ 680.        ,    0.9615978...],
+                          [ 690.        ,    0.9732214...],
+                          [ 700.        ,    0.9806375...],
+                          [ 710.        ,    0.9855738...],
+                          [ 720.        ,    0.9889802...],
+                          [ 730.        ,    0.9914039...],
+                          [ 740.        ,    0.9931741...],
+                          [ 750.        ,    0.9944961...],
+                          [ 760.        ,    0.9955027...],
+                          [ 770.        ,    0.9962823...],
+                          [ 780.        ,    0.9968949...]],
                          interpolator=SpragueInterpolator,
                          interpolator_kwargs={},
                          extrapolator=Extrapolator,
                          extrapolator_kwargs={...})
     >>> sd_to_XYZ_integration(sd, cmfs, illuminant) / 100  # doctest: +ELLIPSIS
-    array([ 0.2065841...,  0.1220125...,  0.0514023...])
+    array([ 0.2065404...,  0.1219726...,  0.0513696...])
     """
 
     XYZ = to_domain_1(XYZ)
@@ -601,6 +865,7 @@ class LUT3D_Jakob2019:
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.generate`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_coefficients`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_sd`
+    -   :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_msds`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.read`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.write`
 
@@ -628,49 +893,49 @@ class LUT3D_Jakob2019:
     >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
     >>> with numpy_print_options(suppress=True):
     ...     LUT.RGB_to_sd(RGB, cmfs.shape)  # doctest: +ELLIPSIS
-    SpectralDistribution([[ 360.        ,    0.7666362...],
-                          [ 370.        ,    0.6251086...],
-                          [ 380.        ,    0.4584017...],
-                          [ 390.        ,    0.3161559...],
-                          [ 400.        ,    0.2196213...],
-                          [ 410.        ,    0.1596688...],
-                          [ 420.        ,    0.1225656...],
-                          [ 430.        ,    0.0989919...],
-                          [ 440.        ,    0.0835916...],
-                          [ 450.        ,    0.0733669...],
-                          [ 460.        ,    0.0666183...],
-                          [ 470.        ,    0.0623707...],
-                          [ 480.        ,    0.0600743...],
-                          [ 490.        ,    0.0594537...],
-                          [ 500.        ,    0.0604370...],
-                          [ 510.        ,    0.0631385...],
-                          [ 520.        ,    0.0678869...],
-                          [ 530.        ,    0.0753101...],
-                          [ 540.        ,    0.0865126...],
-                          [ 550.        ,    0.1034213...],
-                          [ 560.        ,    0.1294488...],
-                          [ 570.        ,    0.1706888...],
-                          [ 580.        ,    0.2375459...],
-                          [ 590.        ,    0.3441276...],
-                          [ 600.        ,    0.4952667...],
-                          [ 610.        ,    0.660606 ...],
-                          [ 620.        ,    0.7915809...],
-                          [ 630.        ,    0.8739343...],
-                          [ 640.        ,    0.9213543...],
-                          [ 650.        ,    0.9487058...],
-                          [ 660.        ,    0.9650651...],
-                          [ 670.        ,    0.9752897...],
-                          [ 680.        ,    0.9819535...],
-                          [ 690.        ,    0.9864608...],
-                          [ 700.        ,    0.9896088...],
-                          [ 710.        ,    0.9918690...],
-                          [ 720.        ,    0.9935308...],
-                          [ 730.        ,    0.9947782...],
-                          [ 740.        ,    0.9957315...],
-                          [ 750.        ,    0.9964717...],
-                          [ 760.        ,    0.9970544...],
-                          [ 770.        ,    0.9975191...],
-                          [ 780.        ,    0.9978937...]],
+    SpectralDistribution([[ 360.        ,    0.7677637...],
+                          [ 370.        ,    0.6265723...],
+                          [ 380.        ,    0.4597655...],
+                          [ 390.        ,    0.3170868...],
+                          [ 400.        ,    0.2201614...],
+                          [ 410.        ,    0.1599679...],
+                          [ 420.        ,    0.1227307...],
+                          [ 430.        ,    0.0990825...],
+                          [ 440.        ,    0.0836393...],
+                          [ 450.        ,    0.0733885...],
+                          [ 460.        ,    0.0666232...],
+                          [ 470.        ,    0.0623641...],
+                          [ 480.        ,    0.0600593...],
+                          [ 490.        ,    0.0594318...],
+                          [ 500.        ,    0.0604091...],
+                          [ 510.        ,    0.0631048...],
+                          [ 520.        ,    0.0678470...],
+                          [ 530.        ,    0.0752634...],
+                          [ 540.        ,    0.0864581...],
+                          [ 550.        ,    0.1033580...],
+                          [ 560.        ,    0.1293767...],
+                          [ 570.        ,    0.1706117...],
+                          [ 580.        ,    0.2374792...],
+                          [ 590.        ,    0.3441107...],
+                          [ 600.        ,    0.495351...],
+                          [ 610.        ,    0.6607789...],
+                          [ 620.        ,    0.7917623...],
+                          [ 630.        ,    0.8740772...],
+                          [ 640.        ,    0.9214564...],
+                          [ 650.        ,    0.9487775...],
+                          [ 660.        ,    0.9651162...],
+                          [ 670.        ,    0.9753270...],
+                          [ 680.        ,    0.9819813...],
+                          [ 690.        ,    0.986481...],
+                          [ 700.        ,    0.9896252...],
+                          [ 710.        ,    0.9918820...],
+                          [ 720.        ,    0.9935413...],
+                          [ 730.        ,    0.9947867...],
+                          [ 740.        ,    0.9957385...],
+                          [ 750.        ,    0.9964775...],
+                          [ 760.        ,    0.9970593...],
+                          [ 770.        ,    0.9975232...],
+                          [ 780.        ,    0.9978972...]],
                          interpolator=SpragueInterpolator,
                          interpolator_kwargs={},
                          extrapolator=Extrapolator,
@@ -750,6 +1015,63 @@ class LUT3D_Jakob2019:
         self._interpolator = RegularGridInterpolator(
             axes, self._coefficients, bounds_error=False)
 
+    def _interpolate(self, i_m, i_1, i_2, i_3):
+        """
+        Interpolates the coefficients at given lookup indexes.
+
+        This is equivalent to calling the
+        :class:`scipy.interpolate.RegularGridInterpolator` class instance
+        returned by :attr:`colour.recovery.LUT3D_Jakob2019.interpolator`
+        attribute but takes advantage of the table structure: the cube is
+        selected by the integer index of the maximum component, the chroma
+        axes are uniformly sampled and only the lightness axis needs to be
+        searched.
+
+        Parameters
+        ----------
+        i_m : ndarray, (N,)
+            Index of the maximum *RGB* component, i.e. the cube index.
+        i_1 : ndarray, (N,)
+            Value of the maximum *RGB* component, i.e. the lightness.
+        i_2 : ndarray, (N,)
+            First chroma component.
+        i_3 : ndarray, (N,)
+            Second chroma component.
+
+        Returns
+        -------
+        ndarray, (N, 3)
+            Interpolated coefficients, *NaN* for indexes out of the table
+            domain.
+        """
+
+        scale = self._lightness_scale
+        size = self._coefficients.shape[2]
+
+        i_L = np.clip(
+            np.searchsorted(scale, i_1, side='right') - 1, 0,
+            len(scale) - 2)
+        t_L = (i_1 - scale[i_L]) / (scale[i_L + 1] - scale[i_L])
+
+        x, y = i_2 * (size - 1), i_3 * (size - 1)
+        i_x = np.clip(np.floor(x).astype(np.int_), 0, size - 2)
+        i_y = np.clip(np.floor(y).astype(np.int_), 0, size - 2)
+        t_x, t_y = x - i_x, y - i_y
+
+        coefficients = zeros([len(i_m), 3])
+        for d_L, d_x, d_y in np.ndindex(2, 2, 2):
+            weights = ((t_L if d_L else 1 - t_L) * (t_x if d_x else 1 - t_x) *
+                       (t_y if d_y else 1 - t_y))
+            coefficients += (weights[..., np.newaxis] * self._coefficients[
+                i_m, i_L + d_L, i_x + d_x, i_y + d_y])
+
+        coefficients[np.logical_or.reduce([
+            i_1 < scale[0], i_1 > scale[-1], i_2 < 0, i_2 > 1, i_3 < 0,
+            i_3 > 1
+        ])] = np.nan
+
+        return coefficients
+
     def generate(self,
                  colourspace,
                  cmfs=MSDS_CMFS_STANDARD_OBSERVER[
@@ -810,11 +1132,7 @@ class LUT3D_Jakob2019:
 
         shape = cmfs.shape
 
-        if illuminant.shape != shape:
-            runtime_warning(
-                'Aligning "{0}" illuminant shape to "{1}" colour matching '
-                'functions shape.'.format(illuminant.name, cmfs.name))
-            illuminant = illuminant.copy().align(cmfs.shape)
+        illuminant = _align_illuminant(illuminant, cmfs, shape)
 
         xy_n = XYZ_to_xy(sd_to_XYZ(illuminant, cmfs))
 
@@ -824,8 +1142,14 @@ class LUT3D_Jakob2019:
         chroma_steps = size
 
         self._lightness_scale = lightness_scale(lightness_steps)
+        # The coefficients are stored in single precision, as in the
+        # "*.coeff" files: it halves the table memory footprint and lookup
+        # bandwidth with a negligible effect on the recovered colours. Half
+        # precision is not suitable because of the cancellation between the
+        # dimensionful coefficients terms.
         self._coefficients = np.empty(
-            [3, chroma_steps, chroma_steps, lightness_steps, 3])
+            [3, chroma_steps, chroma_steps, lightness_steps, 3],
+            dtype=np.float32)
 
         cube_indexes = np.ndindex(3, chroma_steps, chroma_steps)
         total_coefficients = chroma_steps ** 2 * 3
@@ -922,22 +1246,22 @@ class LUT3D_Jakob2019:
         ...     RGB_COLOURSPACE_sRGB, cmfs, illuminant, 3, lambda x: x)
         >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
         >>> LUT.RGB_to_coefficients(RGB)  # doctest: +ELLIPSIS
-        array([  1.5012557...e-04,  -1.4678661...e-01,   3.4017293...e+01])
+        array([  1.5028053...e-04,  -1.4695023...e-01,   3.4059848...e+01])
         """
 
         RGB = as_float_array(RGB)
+        shape = RGB.shape
 
-        value_max = np.max(RGB, axis=-1)
-        chroma = RGB / (np.expand_dims(value_max, -1) + 1e-10)
+        RGB = np.reshape(RGB, [-1, 3])
+        i = np.arange(RGB.shape[0])
 
         i_m = np.argmax(RGB, axis=-1)
-        i_1 = index_along_last_axis(RGB, i_m)
-        i_2 = index_along_last_axis(chroma, (i_m + 2) % 3)
-        i_3 = index_along_last_axis(chroma, (i_m + 1) % 3)
-
-        indexes = np.stack([i_m, i_1, i_2, i_3], axis=-1)
+        i_1 = RGB[i, i_m]
+        i_2 = RGB[i, (i_m + 2) % 3] / (i_1 + 1e-10)
+        i_3 = RGB[i, (i_m + 1) % 3] / (i_1 + 1e-10)
 
-        return self._interpolator(indexes).squeeze()
+        return np.reshape(self._interpolate(i_m, i_1, i_2, i_3),
+                          shape).squeeze()
 
     def RGB_to_sd(self, RGB, shape=SPECTRAL_SHAPE_JAKOB2019):
         """
@@ -971,49 +1295,49 @@ class LUT3D_Jakob2019:
         >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
         >>> with numpy_print_options(suppress=True):
         ...     LUT.RGB_to_sd(RGB, cmfs.shape)  # doctest: +ELLIPSIS
-        SpectralDistribution([[ 360.        ,    0.7666362...],
-                              [ 370.        ,    0.6251086...],
-                              [ 380.        ,    0.4584017...],
-                              [ 390.        ,    0.3161559...],
-                              [ 400.        ,    0.2196213...],
-                              [ 410.        ,    0.1596688...],
-                              [ 420.        ,    0.1225656...],
-                              [ 430.        ,    0.0989919...],
-                              [ 440.        ,    0.0835916...],
-                              [ 450.        ,    0.0733669...],
-                              [ 460.        ,    0.0666183...],
-                              [ 470.        ,    0.0623707...],
-                              [ 480.        ,    0.0600743...],
-                              [ 490.        ,    0.0594537...],
-                              [ 500.        ,    0.0604370...],
-                              [ 510.        ,    0.0631385...],
-                              [ 520.        ,    0.0678869...],
-                              [ 530.        ,    0.0753101...],
-                              [ 540.        ,    0.0865126...],
-                              [ 550.        ,    0.1034213...],
-                              [ 560.        ,    0.1294488...],
-                              [ 570.        ,    0.1706888...],
-                              [ 580.        ,    0.2375459...],
-                              [ 590.        ,    0.3441276...],
-                              [ 600.        ,    0.4952667...],
-                              [ 610.        ,    0.660606 ...],
-                              [ 620.        ,    0.7915809...],
-                              [ 630.        ,    0.8739343...],
-                              [ 640.        ,    0.9213543...],
-                              [ 650.        ,    0.9487058...],
-                              [ 660.        ,    0.9650651...],
-                              [ 670.        ,    0.9752897...],
-                              [ 680.        ,    0.9819535...],
-                              [ 690.        ,    0.9864608...],
-                              [ 700.        ,    0.9896088...],
-                              [ 710.        ,    0.9918690...],
-                              [ 720.        ,    0.9935308...],
-                              [ 730.        ,    0.9947782...],
-                              [ 740.        ,    0.9957315...],
-                              [ 750.        ,    0.9964717...],
-                              [ 760.        ,    0.9970544...],
-                              [ 770.        ,    0.9975191...],
-                              [ 780.        ,    0.9978937...]],
+        SpectralDistribution([[ 360.        ,    0.7677637...],
+                              [ 370.        ,    0.6265723...],
+                              [ 380.        ,    0.4597655...],
+                              [ 390.        ,    0.3170868...],
+                              [ 400.        ,    0.2201614...],
+                              [ 410.        ,    0.1599679...],
+                              [ 420.        ,    0.1227307...],
+                              [ 430.        ,    0.0990825...],
+                              [ 440.        ,    0.0836393...],
+                              [ 450.        ,    0.0733885...],
+                              [ 460.        ,    0.0666232...],
+                              [ 470.        ,    0.0623641...],
+                              [ 480.        ,    0.0600593...],
+                              [ 490.        ,    0.0594318...],
+                              [ 500.        ,    0.0604091...],
+                              [ 510.        ,    0.0631048...],
+                              [ 520.        ,    0.0678470...],
+                              [ 530.        ,    0.0752634...],
+                              [ 540.        ,    0.0864581...],
+                              [ 550.        ,    0.1033580...],
+                              [ 560.        ,    0.1293767...],
+                              [ 570.        ,    0.1706117...],
+                              [ 580.        ,    0.2374792...],
+                              [ 590.        ,    0.3441107...],
+                              [ 600.        ,    0.495351...],
+                              [ 610.        ,    0.6607789...],
+                              [ 620.        ,    0.7917623...],
+                              [ 630.        ,    0.8740772...],
+                              [ 640.        ,    0.9214564...],
+                              [ 650.        ,    0.9487775...],
+                              [ 660.        ,    0.9651162...],
+                              [ 670.        ,    0.9753270...],
+                              [ 680.        ,    0.9819813...],
+                              [ 690.        ,    0.986481...],
+                              [ 700.        ,    0.9896252...],
+                              [ 710.        ,    0.9918820...],
+                              [ 720.        ,    0.9935413...],
+                              [ 730.        ,    0.9947867...],
+                              [ 740.        ,    0.9957385...],
+                              [ 750.        ,    0.9964775...],
+                              [ 760.        ,    0.9970593...],
+                              [ 770.        ,    0.9975232...],
+                              [ 780.        ,    0.9978972...]],
                              interpolator=SpragueInterpolator,
                              interpolator_kwargs={},
                              extrapolator=Extrapolator,
@@ -1025,6 +1349,68 @@ class LUT3D_Jakob2019:
 
         return sd
 
+    def RGB_to_msds(self, RGB, shape=SPECTRAL_SHAPE_JAKOB2019):
+        """
+        Looks up given *RGB* colourspace array, e.g. an image, and returns the
+        corresponding multi-spectral distributions values.
+
+        The coefficients lookup and the spectral model evaluation are
+        vectorised over the whole array, which is much faster than calling
+        :meth:`colour.recovery.LUT3D_Jakob2019.RGB_to_sd` method for each
+        *RGB* colourspace array.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array.
+        shape : SpectralShape, optional
+            Shape used by the multi-spectral distributions.
+
+        Returns
+        -------
+        ndarray
+            Multi-spectral distributions values with the wavelengths in the
+            last axis, e.g. for a 512x384 *RGB* image with a spectral shape of
+            77 bins, the returned array shape is (384, 512, 77). The array can
+            be passed to :func:`colour.msds_to_XYZ` definition with the
+            *Integration* method and the same ``shape``, i.e.
+            ``method='Integration'`` and ``shape=shape`` arguments.
+
+        Examples
+        --------
+        >>> from colour.utilities import numpy_print_options
+        >>> from colour.models import RGB_COLOURSPACE_sRGB
+        >>> cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+        ...         'CIE 1931 2 Degree Standard Observer'].copy().align(
+        ...             SpectralShape(360, 780, 10))
+        >>> illuminant = SDS_ILLUMINANTS['D65'].copy().align(cmfs.shape)
+        >>> LUT = LUT3D_Jakob2019()
+        >>> LUT.generate(
+        ...     RGB_COLOURSPACE_sRGB, cmfs, illuminant, 3, lambda x: x)
+        >>> RGB = np.array([[0.70573936, 0.19248266, 0.22354169],
+        ...                 [0.19248266, 0.22354169, 0.70573936]])
+        >>> with numpy_print_options(suppress=True):
+        ...     LUT.RGB_to_msds(RGB, SpectralShape(400, 700, 100))
+        ...     # doctest: +ELLIPSIS
+        array([[ 0.2201614...,  0.0604091...,  0.495351...,  0.9896252...],
+               [ 0.9715858...,  0.3353792...,  0.0552840...,  0.0549231...]])
+        >>> from colour import msds_to_XYZ
+        >>> msds = LUT.RGB_to_msds(RGB, cmfs.shape)
+        >>> msds_to_XYZ(msds, cmfs, illuminant, method='Integration',
+        ...             shape=cmfs.shape) / 100  # doctest: +ELLIPSIS
+        array([[ 0.3713691...,  0.2341694...,  0.0851323...],
+               [ 0.2010190...,  0.1413929...,  0.8453164...]])
+        """
+
+        RGB = as_float_array(RGB)
+
+        # :meth:`colour.recovery.LUT3D_Jakob2019.RGB_to_coefficients` method
+        # squeezes the singleton axes, they are restored so that the returned
+        # array shape always matches the *RGB* colourspace array shape.
+        coefficients = np.reshape(self.RGB_to_coefficients(RGB), RGB.shape)
+
+        return _spectral_model(coefficients, shape.range())
+
     def read(self, path):
         """
         Loads a lookup table from a *\\*.coeff* file.
@@ -1034,6 +1420,15 @@ class LUT3D_Jakob2019:
         path : unicode
             Path to the file.
 
+        Notes
+        -----
+        -   The coefficients are memory-mapped from the file which stays
+            mapped for the lifetime of the lookup table or until
+            :meth:`colour.recovery.LUT3D_Jakob2019.write` method is called.
+            On *Windows*, the file cannot be overwritten by another process
+            or :class:`colour.recovery.LUT3D_Jakob2019` class instance in the
+            meantime.
+
         Examples
         --------
         >>> import os
@@ -1062,10 +1457,16 @@ class LUT3D_Jakob2019:
             self._size = struct.unpack('i', coeff_file.read(4))[0]
             self._lightness_scale = np.fromfile(
                 coeff_file, count=self._size, dtype=np.float32)
-            self._coefficients = np.fromfile(
-                coeff_file, count=3 * (self._size ** 3) * 3, dtype=np.float32)
-            self._coefficients = self._coefficients.reshape(
-                3, self._size, self._size, self._size, 3)
+
+        # The coefficients are memory-mapped so that only the pages of the
+        # file that are actually looked up are read, the copy-on-write mode
+        # keeps them writable without ever modifying the file.
+        self._coefficients = np.memmap(
+            path,
+            dtype=np.float32,
+            mode='c',
+            offset=8 + 4 * self._size,
+            shape=(3, self._size, self._size, self._size, 3))
 
         self._create_interpolator()
 
@@ -1097,8 +1498,18 @@ class LUT3D_Jakob2019:
         >>> LUT.read(path)  # doctest: +SKIP
         """
 
+        # Memory-mapped coefficients are loaded in memory and every reference
+        # to the map is dropped before opening the file: a file with a mapped
+        # view cannot be truncated on *Windows*.
+        if isinstance(self._coefficients, np.memmap):
+            self._coefficients = np.array(self._coefficients)
+            self._create_interpolator()
+
+        lightness_scale = np.asarray(self._lightness_scale, dtype=np.float32)
+        coefficients = np.asarray(self._coefficients, dtype=np.float32)
+
         with open(path, 'wb') as coeff_file:
             coeff_file.write(b'SPEC')
-            coeff_file.write(struct.pack('i', self._coefficients.shape[1]))
-            np.float32(self._lightness_scale).tofile(coeff_file)
-            np.float32(self._coefficients).tofile(coeff_file)
+            coeff_file.write(struct.pack('i', coefficients.shape[1]))
+            lightness_scale.tofile(coeff_file)
+            coefficients.tofile(coeff_file)
@@ -16,7 +16,8 @@ from colour.difference import JND_CIE1976, delta_E_CIE1976
 from colour.models import RGB_COLOURSPACE_sRGB, RGB_to_XYZ, XYZ_to_Lab
 from colour.recovery.jakob2019 import (
     XYZ_to_sd_Jakob2019, sd_Jakob2019, error_function,
-    dimensionalise_coefficients, SPECTRAL_SHAPE_JAKOB2019, LUT3D_Jakob2019)
+    dimensionalise_coefficients, find_coefficients_Jakob2019,
+    SPECTRAL_SHAPE_JAKOB2019, LUT3D_Jakob2019)
 from colour.utilities import domain_range_scale, full, ones, zeros
 
 __author__ = 'Colour Developers'
@@ -27,7 +28,8 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestErrorFunction', 'TestXYZ_to_sd_Jakob2019', 'TestLUT3D_Jakob2019'
+    'TestErrorFunction', 'TestFindCoefficients_Jakob2019',
+    'TestXYZ_to_sd_Jakob2019', 'TestLUT3D_Jakob2019'
 ]
 
 
@@ -132,6 +134,91 @@ class TestErrorFunction(unittest.TestCase):
                 staggered_derrors, approximate_derrors, atol=1e-3, rtol=1e-2)
 
 
+class TestFindCoefficients_Jakob2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.jakob2019.find_coefficients_Jakob2019`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._shape = SPECTRAL_SHAPE_JAKOB2019
+        self._cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(self._shape)
+        self._sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(self._shape)
+
+    def test_n_dimensional_find_coefficients_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.find_coefficients_Jakob2019`
+        definition n-dimensional arrays support.
+        """
+
+        XYZ = np.array([
+            sd_to_XYZ(sd, self._cmfs, self._sd_D65) / 100
+            for sd in SDS_COLOURCHECKERS['ColorChecker N Ohta'].values()
+        ])
+        XYZ = np.reshape(XYZ, (4, 6, 3))
+
+        coefficients, error = find_coefficients_Jakob2019(
+            XYZ, self._cmfs, self._sd_D65)
+
+        self.assertTupleEqual(coefficients.shape, (4, 6, 3))
+        self.assertTupleEqual(error.shape, (4, 6))
+        self.assertLessEqual(np.max(error), JND_CIE1976 / 100)
+
+        for index in np.ndindex(4, 6):
+            sd = sd_Jakob2019(coefficients[index], self._shape)
+
+            self.assertLessEqual(
+                delta_E_CIE1976(
+                    XYZ_to_Lab(sd_to_XYZ(sd, self._cmfs, self._sd_D65) / 100),
+                    XYZ_to_Lab(XYZ[index])), JND_CIE1976 / 100)
+
+    def test_coefficients_0_find_coefficients_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.find_coefficients_Jakob2019`
+        definition starting coefficients usage.
+        """
+
+        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+
+        coefficients_0, _error = find_coefficients_Jakob2019(
+            XYZ,
+            self._cmfs,
+            self._sd_D65,
+            max_error=JND_CIE1976 / 10000,
+            dimensionalise=False)
+
+        # Starting coefficients that already satisfy the maximal error must be
+        # returned as is, i.e. without running the feedback process.
+        coefficients, error = find_coefficients_Jakob2019(
+            XYZ,
+            self._cmfs,
+            self._sd_D65,
+            coefficients_0,
+            dimensionalise=False)
+
+        np.testing.assert_equal(coefficients, coefficients_0)
+        self.assertLessEqual(error, JND_CIE1976 / 100)
+
+    def test_illuminant_alignment_find_coefficients_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.find_coefficients_Jakob2019`
+        definition illuminant alignment.
+        """
+
+        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+
+        np.testing.assert_almost_equal(
+            find_coefficients_Jakob2019(XYZ, self._cmfs,
+                                        SDS_ILLUMINANTS['D65'])[0],
+            find_coefficients_Jakob2019(XYZ, self._cmfs, self._sd_D65)[0],
+            decimal=7)
+
+
 class TestXYZ_to_sd_Jakob2019(unittest.TestCase):
     """
     Defines :func:`colour.recovery.jakob2019.XYZ_to_sd_Jakob2019` definition
@@ -233,7 +320,7 @@ class TestLUT3D_Jakob2019(unittest.TestCase):
         """
 
         required_methods = ('__init__', 'generate', 'RGB_to_coefficients',
-                            'RGB_to_sd', 'read', 'write')
+                            'RGB_to_sd', 'RGB_to_msds', 'read', 'write')
 
         for method in required_methods:
             self.assertIn(method, dir(LUT3D_Jakob2019))
@@ -276,6 +363,119 @@ class TestLUT3D_Jakob2019(unittest.TestCase):
                 self.fail('Delta E for RGB={0} in colourspace {1} is {2}!'
                           .format(RGB, self._RGB_colourspace.name, error))
 
+    def test_read_write(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.read` and
+        :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.write` methods,
+        including writing a lookup table back to the file it was read from.
+        """
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(self._RGB_colourspace, self._cmfs, self._sd_D65, 3,
+                     lambda x: x)
+
+        path = os.path.join(self._temporary_directory, 'Test_Jakob2019.coeff')
+
+        LUT.write(path)
+
+        LUT_r = LUT3D_Jakob2019()
+        LUT_r.read(path)
+
+        # The *\*.coeff* file format stores single precision values.
+        coefficients = np.float32(LUT.coefficients)
+
+        self.assertEqual(LUT_r.size, LUT.size)
+        np.testing.assert_equal(LUT_r.lightness_scale,
+                                np.float32(LUT.lightness_scale))
+        np.testing.assert_equal(LUT_r.coefficients, coefficients)
+
+        # Writing back to the memory-mapped file must release the map first.
+        LUT_r.write(path)
+        self.assertNotIsInstance(LUT_r.coefficients, np.memmap)
+        np.testing.assert_equal(LUT_r.coefficients, coefficients)
+
+        LUT_r.read(path)
+
+        np.testing.assert_equal(LUT_r.coefficients, coefficients)
+
+    def test_RGB_to_coefficients(self):
+        """
+        Tests
+        :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.RGB_to_coefficients`
+        method against
+        :attr:`colour.recovery.jakob2019.LUT3D_Jakob2019.interpolator`
+        attribute.
+        """
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(self._RGB_colourspace, self._cmfs, self._sd_D65, 3,
+                     lambda x: x)
+
+        samples = np.linspace(0, 1, LUT.size)
+        RGB = np.vstack([
+            np.random.RandomState(4).random_sample([1000, 3]),
+            # Grid nodes, including the table edges.
+            np.reshape(
+                np.transpose(
+                    np.meshgrid(LUT.lightness_scale, samples, samples)),
+                [-1, 3]),
+            ones([1, 3]),
+            zeros([1, 3]),
+            # Out of the table domain.
+            np.array([
+                [-0.1, -0.2, -0.3],
+                [0.5, -0.1, 0.2],
+                [1.2, 0.5, 0.3],
+                [0.5, 0.2, 1.1],
+            ]),
+        ])
+
+        i = np.arange(RGB.shape[0])
+        i_m = np.argmax(RGB, axis=-1)
+        i_1 = RGB[i, i_m]
+        i_2 = RGB[i, (i_m + 2) % 3] / (i_1 + 1e-10)
+        i_3 = RGB[i, (i_m + 1) % 3] / (i_1 + 1e-10)
+
+        coefficients = LUT.RGB_to_coefficients(RGB)
+
+        np.testing.assert_allclose(
+            coefficients,
+            LUT.interpolator(np.transpose([i_m, i_1, i_2, i_3])),
+            rtol=1e-7)
+        self.assertTrue(np.all(np.isnan(coefficients[-4:])))
+        self.assertFalse(np.any(np.isnan(coefficients[:-4])))
+
+    def test_RGB_to_msds(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.RGB_to_msds`
+        method.
+        """
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(self._RGB_colourspace, self._cmfs, self._sd_D65, 3,
+                     lambda x: x)
+
+        RGB = np.reshape(np.random.RandomState(4).random_sample(24), (2, 4, 3))
+
+        msds = LUT.RGB_to_msds(RGB, self._shape)
+
+        self.assertTupleEqual(msds.shape, (2, 4, len(self._shape)))
+
+        for index in np.ndindex(2, 4):
+            np.testing.assert_almost_equal(
+                msds[index], LUT.RGB_to_sd(RGB[index], self._shape).values)
+
+        # Singleton axes must be preserved.
+        for shape in [(1, 4, 3), (4, 1, 3), (1, 1, 3)]:
+            RGB_s = np.reshape(RGB[0, :np.prod(shape[:-1])], shape)
+            msds_s = LUT.RGB_to_msds(RGB_s, self._shape)
+
+            self.assertTupleEqual(msds_s.shape,
+                                  shape[:-1] + (len(self._shape), ))
+            np.testing.assert_almost_equal(
+                np.reshape(msds_s, (-1, len(self._shape))),
+                msds[0, :np.prod(shape[:-1])])
+
 
 if __name__ == '__main__':
     unittest.main()